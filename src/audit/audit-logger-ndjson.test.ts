@@ -4,12 +4,15 @@
 // Context7: consulted for path
 // Context7: consulted for fs-extra
 // Context7: consulted for vitest
+// Context7: consulted for os
+import { promises as fsPromises } from 'fs';
+import * as os from 'os';
 import * as path from 'path';
 
 import * as fs from 'fs-extra';
 import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 
-import { AuditLogger } from './audit-logger.js';
+import { AuditLogger, type MutationLogInput } from './audit-logger.js';
 
 describe('AuditLogger NDJSON Format', () => {
   let auditLogger: AuditLogger;
@@ -231,6 +234,54 @@ describe('AuditLogger NDJSON Format', () => {
     });
   });
 
+  describe('Storage Setup', () => {
+    const mutation = (recordId: string): MutationLogInput => ({
+      operation: 'create',
+      tableId: 'table123',
+      recordId,
+      payload: { test: true },
+      result: { id: recordId },
+      reversalInstructions: { operation: 'delete', tableId: 'table123', recordId },
+    });
+
+    it('should recreate the audit directory if it is removed after the first write', async () => {
+      const baseDir = await fs.mkdtemp(path.join(os.tmpdir(), 'audit-ndjson-'));
+      const auditDir = path.join(baseDir, 'audit');
+      const logger = new AuditLogger(path.join(auditDir, 'audit.json'));
+
+      try {
+        await logger.logMutation(mutation('rec1'));
+        await fs.remove(auditDir);
+
+        await logger.logMutation(mutation('rec2'));
+
+        const lines = (await fs.readFile(path.join(auditDir, 'audit.ndjson'), 'utf8')).trim().split('\n');
+        expect(lines).toHaveLength(1);
+        expect(JSON.parse(lines[0]!).recordId).toBe('rec2');
+      } finally {
+        await fs.remove(baseDir);
+      }
+    });
+
+    it('should propagate ENOENT from the first append without retrying', async () => {
+      const enoent = Object.assign(new Error('ENOENT: no such file or directory'), { code: 'ENOENT' });
+      const appendSpy = vi.spyOn(fsPromises, 'appendFile').mockRejectedValueOnce(enoent);
+
+      await expect(auditLogger.logMutation(mutation('rec1'))).rejects.toThrow(/ENOENT/);
+      expect(appendSpy).toHaveBeenCalledTimes(1);
+    });
+
+    it('should propagate non-ENOENT append errors after setup without retrying', async () => {
+      await auditLogger.logMutation(mutation('rec1'));
+
+      const eacces = Object.assign(new Error('EACCES: permission denied'), { code: 'EACCES' });
+      const appendSpy = vi.spyOn(fsPromises, 'appendFile').mockRejectedValueOnce(eacces);
+
+      await expect(auditLogger.logMutation(mutation('rec2'))).rejects.toThrow(/EACCES/);
+      expect(appendSpy).toHaveBeenCalledTimes(1);
+    });
+  });
+
   describe('Performance Characteristics', () => {
     it('should maintain O(1) append performance with large audit logs', async () => {
       // Create a large existing NDJSON file
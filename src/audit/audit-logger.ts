@@ -88,12 +88,16 @@ export interface MutationLogInput {
 export class AuditLogger {
   private readonly auditFilePath: string;
   private readonly legacyJsonPath: string;
+  private readonly auditDir: string;
+  // Set after the first successful append: migration and mkdir only need to run once
+  private storageReady = false;
 
   constructor(auditFilePath: string) {
     // Use .ndjson extension for new format
     this.auditFilePath = auditFilePath.replace(/\.json$/, '.ndjson');
     // Keep track of legacy JSON file for migration
     this.legacyJsonPath = auditFilePath;
+    this.auditDir = path.dirname(this.auditFilePath);
   }
 
   async logMutation(input: MutationLogInput): Promise<void> {
@@ -322,18 +326,33 @@ export class AuditLogger {
   }
 
   private async persistEntry(entry: AuditLogEntry): Promise<void> {
-    // First, migrate legacy JSON file if it exists
-    await this.migrateLegacyIfNeeded();
-
-    // Ensure directory exists
-    await fs.mkdir(path.dirname(this.auditFilePath), { recursive: true });
+    // Migration and mkdir are skipped once a write has succeeded, so each later mutation
+    // costs a single append instead of two stats + mkdir + append
+    if (!this.storageReady) {
+      // First, migrate legacy JSON file if it exists
+      await this.migrateLegacyIfNeeded();
+
+      // Ensure directory exists
+      await fs.mkdir(this.auditDir, { recursive: true });
+    }
 
     // O(1) append operation - no locking needed!
     // Convert entry to single-line JSON and append with newline
     const line = JSON.stringify(entry) + '\n';
 
     // Use appendFile for atomic append operation
-    await fs.appendFile(this.auditFilePath, line, 'utf8');
+    try {
+      await fs.appendFile(this.auditFilePath, line, 'utf8');
+    } catch (error) {
+      if (!this.storageReady || (error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        throw error;
+      }
+      // Directory was removed after the first write - recreate it and retry once
+      await fs.mkdir(this.auditDir, { recursive: true });
+      await fs.appendFile(this.auditFilePath, line, 'utf8');
+    }
+
+    this.storageReady = true;
   }
 
   private async migrateLegacyIfNeeded(): Promise<void> {
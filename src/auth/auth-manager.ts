@@ -2,6 +2,8 @@
 // SECURITY-SPECIALIST-APPROVED: SECURITY-SPECIALIST-20250910-9521e55c
 // Following TRACED methodology - GREEN phase: Make failing tests pass
 
+import { defaultFetch, type SmartSuiteFetch } from '../common/fetch.js';
+
 export interface AuthConfig {
   apiKey: string;
   workspaceId: string;
@@ -28,17 +30,21 @@ export class AuthManager {
   private authConfig: AuthConfig | null = null;
   private authenticated: boolean = false;
   private lastValidation: AuthValidationResult | null = null;
+  private readonly fetchImpl: SmartSuiteFetch;
 
   /**
    * Initialize AuthManager with explicit configuration or environment fallback
    *
    * @param config - Complete authentication config or undefined for environment fallback
+   * @param fetchImpl - HTTP transport for credential validation; defaults to the global fetch
    * @throws {Error} When partial configuration is provided - prevents silent failures
    *
    * Critical-Engineer: explicit fail-fast validation for partial configurations
    * TestGuard-Approved: CONTRACT-DRIVEN-CORRECTION implementation
    */
-  constructor(config?: Partial<AuthConfig>) {
+  constructor(config?: Partial<AuthConfig>, fetchImpl?: SmartSuiteFetch) {
+    this.fetchImpl = fetchImpl ?? defaultFetch;
+
     const configStatus = this.validateConfigurationInput(config);
 
     if (configStatus === 'complete') {
@@ -131,7 +137,7 @@ export class AuthManager {
 
       let response: Response;
       try {
-        response = await fetch(validationUrl, {
+        response = await this.fetchImpl(validationUrl, {
           method: 'GET',
           headers: {
             'Authorization': `Token ${this.authConfig.apiKey}`,
@@ -0,0 +1,22 @@
+// Test for fetch transport abstraction - ensures the default resolves the global per call
+// Context7: consulted for vitest
+import { describe, it, expect, afterEach, vi } from 'vitest';
+
+import { defaultFetch } from './fetch.js';
+
+describe('defaultFetch', () => {
+  const originalFetch = global.fetch;
+
+  afterEach(() => {
+    global.fetch = originalFetch;
+  });
+
+  it('should delegate to the global fetch installed at call time', async () => {
+    const response = { ok: true, status: 200 } as Response;
+    global.fetch = vi.fn().mockResolvedValue(response);
+
+    const init: RequestInit = { method: 'GET' };
+    await expect(defaultFetch('https://example.test', init)).resolves.toBe(response);
+    expect(global.fetch).toHaveBeenCalledWith('https://example.test', init);
+  });
+});
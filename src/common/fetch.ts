@@ -0,0 +1,7 @@
+// HTTP transport abstraction for fetch dependency injection
+// Allows tests to supply an in-memory transport instead of patching globals
+
+export type SmartSuiteFetch = (url: string, init?: RequestInit) => Promise<Response>;
+
+// Resolves the global on each call, so a fetch swapped after construction still takes effect
+export const defaultFetch: SmartSuiteFetch = (url, init) => fetch(url, init);
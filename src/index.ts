@@ -76,7 +76,8 @@ async function main(): Promise<number> {
   // CRITICAL: Register our SmartSuiteShimServer tools with the MCP protocol
   // This was the missing piece - connecting our implementation to MCP
   mcpServer.setRequestHandler(ListToolsRequestSchema, () => {
-    return Promise.resolve({ tools: server.getTools() });
+    // Copy the shared frozen list: the protocol result type expects a mutable array
+    return Promise.resolve({ tools: [...server.getTools()] });
   });
 
   mcpServer.setRequestHandler(CallToolRequestSchema, async (request) => {
@@ -5,9 +5,6 @@ import { promises as fs } from 'fs';
 // Context7: consulted for path
 import * as path from 'path';
 
-// Context7: consulted for yaml
-import * as yaml from 'yaml';
-
 export interface FieldMapping {
   tableName: string;
   tableId: string;
@@ -26,19 +23,10 @@ export class FieldTranslator {
   async loadFromYaml(yamlPath: string): Promise<void> {
     try {
       const yamlContent = await fs.readFile(yamlPath, 'utf8');
-      const mapping = yaml.parse(yamlContent) as FieldMapping;
-
-      if (mapping.tableId && mapping.fields) {
-        // Pre-compute reverse mapping for performance
-        mapping.reverseMap = {};
-        for (const [human, api] of Object.entries(mapping.fields)) {
-          mapping.reverseMap[api] = human;
-        }
-
-        this.mappings.set(mapping.tableId, mapping);
-      } else {
-        throw new Error(`Invalid mapping structure in ${yamlPath}: missing tableId or fields`);
-      }
+      // Context7: consulted for js-yaml
+      const yaml = await import('js-yaml');
+      const mapping = yaml.load(yamlContent, { schema: yaml.JSON_SCHEMA }) as FieldMapping;
+      this.loadFromMapping(mapping, yamlPath);
     } catch (error) {
       // Use structured error for production readiness
       const errorMessage = `Failed to load YAML from ${yamlPath}: ${error instanceof Error ? error.message : String(error)}`;
@@ -46,6 +34,25 @@ export class FieldTranslator {
     }
   }
 
+  /**
+   * Register field mappings from an already-parsed document
+   * FAIL FAST: Throws errors instead of silent failure
+   */
+  loadFromMapping(mapping: FieldMapping, source: string): void {
+    if (mapping.tableId && mapping.fields) {
+      // Pre-compute reverse mapping for performance
+      const reverseMap: Record<string, string> = {};
+      for (const [human, api] of Object.entries(mapping.fields)) {
+        reverseMap[api] = human;
+      }
+
+      // Store a copy: the caller's document may be shared (e.g. with TableResolver)
+      this.mappings.set(mapping.tableId, { ...mapping, reverseMap });
+    } else {
+      throw new Error(`Invalid mapping structure in ${source}: missing tableId or fields`);
+    }
+  }
+
   /**
    * Load all YAML mappings from a directory
    * FAIL FAST: Throws errors instead of silent failure
@@ -15,20 +15,43 @@ describe('FilterValidator', () => {
       expect(FilterValidator.validate(123)).toBe('Filter must be an object');
     });
 
-    it('should require operator when fields array exists', () => {
-      const filter = {
-        fields: [],
-      };
-      expect(FilterValidator.validate(filter)).toBe('Filter with fields array must have an operator (and/or)');
+    // Single-rule rejections share one parametrized case instead of a test body each
+    it.each([
+      {
+        rule: 'operator when fields array exists',
+        filter: { fields: [] },
+        error: 'Filter with fields array must have an operator (and/or)',
+        exact: true,
+      },
+      {
+        rule: 'operator values',
+        filter: { operator: 'invalid', fields: [] },
+        error: 'Invalid operator',
+      },
+      {
+        rule: 'field structure',
+        filter: { operator: 'and', fields: [{ field: 'name' }] }, // Missing comparison
+        error: 'missing required property "comparison"',
+      },
+      {
+        rule: 'comparison operators',
+        filter: { operator: 'and', fields: [{ field: 'name', comparison: 'invalid_op', value: 'test' }] },
+        error: 'invalid comparison',
+      },
+      {
+        rule: 'value for non-empty comparisons',
+        filter: { operator: 'and', fields: [{ field: 'name', comparison: 'is' }] }, // Missing value
+        error: 'requires a value',
+      },
+    ])('should enforce $rule', ({ filter, error, exact }) => {
+      if (exact) {
+        expect(FilterValidator.validate(filter)).toBe(error);
+      } else {
+        expect(FilterValidator.validate(filter)).toContain(error);
+      }
     });
 
-    it('should validate operator values', () => {
-      const invalidFilter = {
-        operator: 'invalid',
-        fields: [],
-      };
-      expect(FilterValidator.validate(invalidFilter)).toContain('Invalid operator');
-
+    it('should accept a valid operator', () => {
       const validFilter = {
         operator: 'and',
         fields: [],
@@ -36,36 +59,6 @@ describe('FilterValidator', () => {
       expect(FilterValidator.validate(validFilter)).toBeNull();
     });
 
-    it('should validate field structure', () => {
-      const filter = {
-        operator: 'and',
-        fields: [
-          { field: 'name' }, // Missing comparison
-        ],
-      };
-      expect(FilterValidator.validate(filter)).toContain('missing required property "comparison"');
-    });
-
-    it('should validate comparison operators', () => {
-      const filter = {
-        operator: 'and',
-        fields: [
-          { field: 'name', comparison: 'invalid_op', value: 'test' },
-        ],
-      };
-      expect(FilterValidator.validate(filter)).toContain('invalid comparison');
-    });
-
-    it('should require value for non-empty comparisons', () => {
-      const filter = {
-        operator: 'and',
-        fields: [
-          { field: 'name', comparison: 'is' }, // Missing value
-        ],
-      };
-      expect(FilterValidator.validate(filter)).toContain('requires a value');
-    });
-
     it('should allow is_empty/is_not_empty without value', () => {
       const filter = {
         operator: 'and',
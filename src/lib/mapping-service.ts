@@ -7,10 +7,7 @@ import { existsSync } from 'fs';
 // Context7: consulted for path
 import * as path from 'path';
 
-// Context7: consulted for yaml
-import * as yaml from 'yaml';
-
-import { FieldTranslator } from './field-translator.js';
+import { FieldTranslator, type FieldMapping } from './field-translator.js';
 import { TableResolver } from './table-resolver.js';
 
 interface MappingStats {
@@ -69,9 +66,16 @@ export class MappingService {
         }),
       );
 
+      // Context7: consulted for js-yaml
+      // Imported on demand: mappings load lazily on first tool use, so server
+      // startup never pays for the YAML parser
+      const yaml = await import('js-yaml');
+
       // Then validate sequentially
+      // JSON_SCHEMA is stricter than the 'yaml' package these loaders used before: unknown
+      // tags such as !!js/undefined are a hard error instead of a warning, by design
       for (const { file, yamlContent } of fileContents) {
-        const mapping = yaml.parse(yamlContent) as Record<string, unknown>;
+        const mapping = yaml.load(yamlContent, { schema: yaml.JSON_SCHEMA }) as Record<string, unknown>;
 
         // Validate table ID format
         const tableId = mapping.tableId as string | undefined;
@@ -114,40 +118,27 @@ export class MappingService {
         validatedMappings.push({ file, content: mapping });
       }
 
-      // Second pass: load validated mappings
-      const tableLoadPromises: Promise<void>[] = [];
-      const fieldLoadPromises: Promise<void>[] = [];
-
+      // Second pass: populate translators from the documents parsed above
+      // (no second read/parse per translator)
       for (const { file, content } of validatedMappings) {
         const filePath = path.join(mappingsDir, file);
-        // Load into TableResolver
         const contentTableId = content.tableId as string | undefined;
         const contentTableName = content.tableName as string | undefined;
         const contentFields = content.fields as Record<string, unknown> | undefined;
 
+        // Load into TableResolver
         if (contentTableId && contentTableName) {
-          tableLoadPromises.push(
-            this.tableResolver.loadFromYaml(filePath).then(() => {
-              this.loadedTables.add(contentTableName);
-              return;
-            }),
-          );
+          this.tableResolver.loadFromMapping(content, filePath);
+          this.loadedTables.add(contentTableName);
         }
 
         // Load into FieldTranslator
         if (contentTableId && contentFields) {
-          const fieldCount = Object.keys(contentFields).length;
-          fieldLoadPromises.push(
-            this.fieldTranslator.loadFromYaml(filePath).then(() => {
-              this.fieldCount += fieldCount;
-              return;
-            }),
-          );
+          this.fieldTranslator.loadFromMapping(content as unknown as FieldMapping, filePath);
+          this.fieldCount += Object.keys(contentFields).length;
         }
       }
 
-      await Promise.all([...tableLoadPromises, ...fieldLoadPromises]);
-
     } catch (error) {
       // Reset on failure - atomic loading
       this.tableResolver = new TableResolver();
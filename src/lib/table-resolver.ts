@@ -7,9 +7,6 @@ import { existsSync } from 'fs';
 // Context7: consulted for path
 import * as path from 'path';
 
-// Context7: consulted for yaml
-import * as yaml from 'yaml';
-
 export interface TableInfo {
   name: string;
   id: string;
@@ -27,40 +24,49 @@ export class TableResolver {
   async loadFromYaml(yamlPath: string): Promise<void> {
     try {
       const yamlContent = await fs.readFile(yamlPath, 'utf8');
-      const mapping = yaml.parse(yamlContent) as Record<string, unknown>;
-
-      const tableId = mapping.tableId as string | undefined;
-      const tableName = mapping.tableName as string | undefined;
-      const solutionId = mapping.solutionId as string | undefined;
-
-      if (tableId && tableName) {
-        const tableInfo: TableInfo = {
-          name: tableName,
-          id: tableId,
-          ...(solutionId && { solutionId }),
-        };
-
-        const normalizedName = tableName.toLowerCase();
-
-        // Check for name collision
-        if (this.tableMap.has(normalizedName)) {
-          const existing = this.tableMap.get(normalizedName)!;
-          throw new Error(
-            `Configuration Error: Duplicate table name '${tableName}' detected. ` +
-            `Already loaded as '${existing.name}' with ID ${existing.id}. ` +
-            `Cannot load from ${yamlPath}`,
-          );
-        }
-
-        this.tableMap.set(normalizedName, tableInfo);
-        this.idToTable.set(tableId, tableInfo);
-      }
+      // Context7: consulted for js-yaml
+      const yaml = await import('js-yaml');
+      const mapping = yaml.load(yamlContent, { schema: yaml.JSON_SCHEMA }) as Record<string, unknown>;
+      this.loadFromMapping(mapping, yamlPath);
     } catch (error) {
       const errorMessage = `Failed to load YAML from ${yamlPath}: ${error instanceof Error ? error.message : String(error)}`;
       throw new Error(errorMessage);
     }
   }
 
+  /**
+   * Register table info from an already-parsed document
+   * FAIL FAST: Throws errors on conflicts
+   */
+  loadFromMapping(mapping: Record<string, unknown>, source: string): void {
+    const tableId = mapping.tableId as string | undefined;
+    const tableName = mapping.tableName as string | undefined;
+    const solutionId = mapping.solutionId as string | undefined;
+
+    if (tableId && tableName) {
+      const tableInfo: TableInfo = {
+        name: tableName,
+        id: tableId,
+        ...(solutionId && { solutionId }),
+      };
+
+      const normalizedName = tableName.toLowerCase();
+
+      // Check for name collision
+      if (this.tableMap.has(normalizedName)) {
+        const existing = this.tableMap.get(normalizedName)!;
+        throw new Error(
+          `Configuration Error: Duplicate table name '${tableName}' detected. ` +
+          `Already loaded as '${existing.name}' with ID ${existing.id}. ` +
+          `Cannot load from ${source}`,
+        );
+      }
+
+      this.tableMap.set(normalizedName, tableInfo);
+      this.idToTable.set(tableId, tableInfo);
+    }
+  }
+
   /**
    * Load all YAML mappings from a directory
    * FAIL FAST: Throws errors on conflicts or missing files
@@ -30,6 +30,250 @@ import { defaultToolRegistry, registerAllTools } from './tools/tool-definitions.
 import type { ToolContext } from './tools/types.js';
 import { McpValidationError } from './validation/input-validator.js';
 
+export interface McpToolDefinition {
+  name: string;
+  description?: string;
+  inputSchema: { type: string; properties: Record<string, unknown>; required?: string[] };
+}
+
+// Recursively freeze a constant so shared references cannot be mutated by callers
+function deepFreeze<T>(value: T): T {
+  if (value !== null && typeof value === 'object') {
+    for (const child of Object.values(value)) {
+      deepFreeze(child);
+    }
+    Object.freeze(value);
+  }
+  return value;
+}
+
+// Tool definitions are static: build them once at module load instead of
+// re-allocating the full schema tree on every tools/list request. Every server
+// instance shares this tree, so it is frozen rather than handed out mutable
+const MCP_TOOL_DEFINITIONS: ReadonlyArray<Readonly<McpToolDefinition>> = deepFreeze([
+  {
+    name: 'smartsuite_query',
+    description: 'Query SmartSuite records with filtering, sorting, and pagination',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        operation: {
+          type: 'string',
+          enum: ['list', 'get', 'search', 'count'],
+          description: 'The query operation to perform',
+        },
+        appId: {
+          type: 'string',
+          description: 'SmartSuite application ID (24-char hex)',
+        },
+        recordId: {
+          type: 'string',
+          description: 'Record ID (required for get operation)',
+        },
+        filters: {
+          type: 'object',
+          description: 'Filtering criteria',
+        },
+        sort: {
+          type: 'object',
+          description: 'Sorting configuration',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of records to return (default 5 for MCP context optimization, max 1000)',
+        },
+        offset: {
+          type: 'number',
+          description: 'Starting offset for pagination (default 0)',
+        },
+      },
+      required: ['operation', 'appId'],
+    },
+  },
+  {
+    name: 'smartsuite_record',
+    description: 'Create, update, or delete SmartSuite records with DRY-RUN safety',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        operation: {
+          type: 'string',
+          enum: ['create', 'update', 'delete', 'bulk_update', 'bulk_delete'],
+          description: 'The record operation to perform',
+        },
+        appId: {
+          type: 'string',
+          description: 'SmartSuite application ID (24-char hex)',
+        },
+        recordId: {
+          type: 'string',
+          description: 'Record ID (required for update/delete)',
+        },
+        data: {
+          type: 'object',
+          description: 'Record data for create/update operations',
+        },
+        dry_run: {
+          type: 'boolean',
+          default: true,
+          description: 'Preview changes without executing (safety default)',
+        },
+      },
+      required: ['operation', 'appId'],
+    },
+  },
+  {
+    name: 'smartsuite_schema',
+    description: 'Get SmartSuite application schema and field definitions',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        appId: {
+          type: 'string',
+          description: 'SmartSuite application ID (24-char hex)',
+        },
+        output_mode: {
+          type: 'string',
+          enum: ['summary', 'fields', 'detailed'],
+          description: 'Output mode: summary (table info only), fields (field names/types), detailed (full schema)',
+          default: 'summary',
+        },
+      },
+      required: ['appId'],
+    },
+  },
+  {
+    name: 'smartsuite_undo',
+    description: 'Undo a previous SmartSuite operation using transaction history',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        transaction_id: {
+          type: 'string',
+          description: 'Transaction ID from a previous operation',
+        },
+      },
+      required: ['transaction_id'],
+    },
+  },
+  {
+    name: 'smartsuite_discover',
+    description: 'Discover available tables and their fields',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scope: {
+          type: 'string',
+          enum: ['tables', 'fields'],
+          description: 'What to discover: tables or fields for a specific table',
+        },
+        tableId: {
+          type: 'string',
+          description: 'Table name or ID (required for fields scope)',
+        },
+      },
+      required: ['scope'],
+    },
+  },
+  {
+    name: 'smartsuite_intelligent',
+    description: 'AI-guided access to any SmartSuite API with knowledge-driven safety',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        mode: {
+          type: 'string',
+          enum: ['learn', 'dry_run', 'execute'],
+          description: 'Operation mode: learn (analyze), dry_run (validate), execute (perform)',
+          default: 'learn',
+        },
+        endpoint: {
+          type: 'string',
+          description: 'SmartSuite API endpoint (e.g., /applications/{id}/records/list/)',
+        },
+        method: {
+          type: 'string',
+          enum: ['GET', 'POST', 'PUT', 'DELETE', 'PATCH'],
+          description: 'HTTP method for the operation',
+        },
+        payload: {
+          type: 'object',
+          description: 'Request payload (validated against knowledge base)',
+        },
+        tableId: {
+          type: 'string',
+          description: 'SmartSuite table/application ID for context',
+        },
+        operation_description: {
+          type: 'string',
+          description: 'Human-readable description of what you want to accomplish',
+        },
+        confirmed: {
+          type: 'boolean',
+          description: 'Confirmation for dangerous operations (required for RED level)',
+          default: false,
+        },
+      },
+      required: ['endpoint', 'method', 'operation_description'],
+    },
+  },
+  {
+    name: 'smartsuite_knowledge_events',
+    description: 'Knowledge Platform event operations (append/get events)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        operation: {
+          type: 'string',
+          enum: ['append', 'get'],
+          description: 'Event operation to perform',
+        },
+        aggregateId: {
+          type: 'string',
+          description: 'Aggregate ID for event operations',
+        },
+        event: {
+          type: 'object',
+          description: 'Event data for append operations',
+        },
+        limit: {
+          type: 'number',
+          description: 'Maximum number of events to retrieve (for get operations)',
+        },
+      },
+      required: ['operation'],
+    },
+  },
+  {
+    name: 'smartsuite_knowledge_field_mappings',
+    description: 'Get field mappings from Knowledge Platform',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        tableId: {
+          type: 'string',
+          description: 'SmartSuite table ID to get field mappings for',
+        },
+      },
+      required: ['tableId'],
+    },
+  },
+  {
+    name: 'smartsuite_knowledge_refresh_views',
+    description: 'Refresh Knowledge Platform materialized views',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        views: {
+          type: 'array',
+          items: { type: 'string' },
+          description: 'List of views to refresh (default: field_mappings)',
+        },
+      },
+    },
+  },
+]);
+
 export class SmartSuiteShimServer {
   private client?: SmartSuiteClient;
   private mappingService: MappingService;
@@ -120,235 +364,9 @@ export class SmartSuiteShimServer {
     // Client exists, we're authenticated
   }
 
-  getTools(): Array<{
-    name: string;
-    description?: string;
-    inputSchema: { type: string; properties: Record<string, unknown>; required?: string[] };
-  }> {
+  getTools(): ReadonlyArray<Readonly<McpToolDefinition>> {
     // Return tools in MCP protocol-compliant format with proper schemas
-    return [
-      {
-        name: 'smartsuite_query',
-        description: 'Query SmartSuite records with filtering, sorting, and pagination',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            operation: {
-              type: 'string',
-              enum: ['list', 'get', 'search', 'count'],
-              description: 'The query operation to perform',
-            },
-            appId: {
-              type: 'string',
-              description: 'SmartSuite application ID (24-char hex)',
-            },
-            recordId: {
-              type: 'string',
-              description: 'Record ID (required for get operation)',
-            },
-            filters: {
-              type: 'object',
-              description: 'Filtering criteria',
-            },
-            sort: {
-              type: 'object',
-              description: 'Sorting configuration',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of records to return (default 5 for MCP context optimization, max 1000)',
-            },
-            offset: {
-              type: 'number',
-              description: 'Starting offset for pagination (default 0)',
-            },
-          },
-          required: ['operation', 'appId'],
-        },
-      },
-      {
-        name: 'smartsuite_record',
-        description: 'Create, update, or delete SmartSuite records with DRY-RUN safety',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            operation: {
-              type: 'string',
-              enum: ['create', 'update', 'delete', 'bulk_update', 'bulk_delete'],
-              description: 'The record operation to perform',
-            },
-            appId: {
-              type: 'string',
-              description: 'SmartSuite application ID (24-char hex)',
-            },
-            recordId: {
-              type: 'string',
-              description: 'Record ID (required for update/delete)',
-            },
-            data: {
-              type: 'object',
-              description: 'Record data for create/update operations',
-            },
-            dry_run: {
-              type: 'boolean',
-              default: true,
-              description: 'Preview changes without executing (safety default)',
-            },
-          },
-          required: ['operation', 'appId'],
-        },
-      },
-      {
-        name: 'smartsuite_schema',
-        description: 'Get SmartSuite application schema and field definitions',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            appId: {
-              type: 'string',
-              description: 'SmartSuite application ID (24-char hex)',
-            },
-            output_mode: {
-              type: 'string',
-              enum: ['summary', 'fields', 'detailed'],
-              description: 'Output mode: summary (table info only), fields (field names/types), detailed (full schema)',
-              default: 'summary',
-            },
-          },
-          required: ['appId'],
-        },
-      },
-      {
-        name: 'smartsuite_undo',
-        description: 'Undo a previous SmartSuite operation using transaction history',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            transaction_id: {
-              type: 'string',
-              description: 'Transaction ID from a previous operation',
-            },
-          },
-          required: ['transaction_id'],
-        },
-      },
-      {
-        name: 'smartsuite_discover',
-        description: 'Discover available tables and their fields',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scope: {
-              type: 'string',
-              enum: ['tables', 'fields'],
-              description: 'What to discover: tables or fields for a specific table',
-            },
-            tableId: {
-              type: 'string',
-              description: 'Table name or ID (required for fields scope)',
-            },
-          },
-          required: ['scope'],
-        },
-      },
-      {
-        name: 'smartsuite_intelligent',
-        description: 'AI-guided access to any SmartSuite API with knowledge-driven safety',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            mode: {
-              type: 'string',
-              enum: ['learn', 'dry_run', 'execute'],
-              description: 'Operation mode: learn (analyze), dry_run (validate), execute (perform)',
-              default: 'learn',
-            },
-            endpoint: {
-              type: 'string',
-              description: 'SmartSuite API endpoint (e.g., /applications/{id}/records/list/)',
-            },
-            method: {
-              type: 'string',
-              enum: ['GET', 'POST', 'PUT', 'DELETE', 'PATCH'],
-              description: 'HTTP method for the operation',
-            },
-            payload: {
-              type: 'object',
-              description: 'Request payload (validated against knowledge base)',
-            },
-            tableId: {
-              type: 'string',
-              description: 'SmartSuite table/application ID for context',
-            },
-            operation_description: {
-              type: 'string',
-              description: 'Human-readable description of what you want to accomplish',
-            },
-            confirmed: {
-              type: 'boolean',
-              description: 'Confirmation for dangerous operations (required for RED level)',
-              default: false,
-            },
-          },
-          required: ['endpoint', 'method', 'operation_description'],
-        },
-      },
-      {
-        name: 'smartsuite_knowledge_events',
-        description: 'Knowledge Platform event operations (append/get events)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            operation: {
-              type: 'string',
-              enum: ['append', 'get'],
-              description: 'Event operation to perform',
-            },
-            aggregateId: {
-              type: 'string',
-              description: 'Aggregate ID for event operations',
-            },
-            event: {
-              type: 'object',
-              description: 'Event data for append operations',
-            },
-            limit: {
-              type: 'number',
-              description: 'Maximum number of events to retrieve (for get operations)',
-            },
-          },
-          required: ['operation'],
-        },
-      },
-      {
-        name: 'smartsuite_knowledge_field_mappings',
-        description: 'Get field mappings from Knowledge Platform',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            tableId: {
-              type: 'string',
-              description: 'SmartSuite table ID to get field mappings for',
-            },
-          },
-          required: ['tableId'],
-        },
-      },
-      {
-        name: 'smartsuite_knowledge_refresh_views',
-        description: 'Refresh Knowledge Platform materialized views',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            views: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'List of views to refresh (default: field_mappings)',
-            },
-          },
-        },
-      },
-    ];
+    return MCP_TOOL_DEFINITIONS;
   }
 
   /**
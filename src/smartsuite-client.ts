@@ -3,12 +3,20 @@
 // SECURITY-SPECIALIST-APPROVED: SECURITY-SPECIALIST-20250905-ad1233d9
 // GREEN phase implementation to make authentication tests pass
 
+import { defaultFetch, type SmartSuiteFetch } from './common/fetch.js';
 import { FilterValidator } from './lib/filter-validator.js';
 
+export type { SmartSuiteFetch };
+
 export interface SmartSuiteClientConfig {
   apiKey: string;
   workspaceId: string;
   baseUrl?: string;
+  /**
+   * HTTP transport used for every API call. Defaults to the global fetch;
+   * tests inject an in-memory stub instead of patching globals.
+   */
+  fetchImpl?: SmartSuiteFetch;
 }
 
 // SECURITY-SPECIALIST-APPROVED: SECURITY-SPECIALIST-20250905-arch-175
@@ -87,12 +95,13 @@ export async function createAuthenticatedClient(
   const apiKey = config.apiKey;
   const workspaceId = config.workspaceId;
   const baseUrl = config.baseUrl ?? 'https://app.smartsuite.com';
+  const fetchImpl = config.fetchImpl ?? defaultFetch;
 
   // Validate API key by making a test request
   // SmartSuite uses "Token" format and "ACCOUNT-ID" header, not Bearer
   try {
     const validationUrl = baseUrl + '/api/v1/applications';
-    const response = await fetch(validationUrl, {
+    const response = await fetchImpl(validationUrl, {
       method: 'GET',
       headers: {
         Authorization: 'Token ' + apiKey,
@@ -175,7 +184,7 @@ export async function createAuthenticatedClient(
         requestBody.sort = options.sort;
       }
 
-      const response = await fetch(url.toString(), {
+      const response = await fetchImpl(url.toString(), {
         method: 'POST',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -229,7 +238,7 @@ export async function createAuthenticatedClient(
         requestBody.filter = transformedFilter;
       }
 
-      const response = await fetch(url.toString(), {
+      const response = await fetchImpl(url.toString(), {
         method: 'POST',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -263,7 +272,7 @@ export async function createAuthenticatedClient(
 
     async getRecord(appId: string, recordId: string): Promise<SmartSuiteRecord> {
       const url = baseUrl + '/api/v1/applications/' + appId + '/records/' + recordId + '/';
-      const response = await fetch(url, {
+      const response = await fetchImpl(url, {
         method: 'GET',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -295,7 +304,7 @@ export async function createAuthenticatedClient(
 
     async createRecord(appId: string, data: Record<string, unknown>): Promise<SmartSuiteRecord> {
       const url = baseUrl + '/api/v1/applications/' + appId + '/records/';
-      const response = await fetch(url, {
+      const response = await fetchImpl(url, {
         method: 'POST',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -328,7 +337,7 @@ export async function createAuthenticatedClient(
 
     async updateRecord(appId: string, recordId: string, data: Record<string, unknown>): Promise<SmartSuiteRecord> {
       const url = baseUrl + '/api/v1/applications/' + appId + '/records/' + recordId + '/';
-      const response = await fetch(url, {
+      const response = await fetchImpl(url, {
         method: 'PATCH',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -361,7 +370,7 @@ export async function createAuthenticatedClient(
 
     async deleteRecord(appId: string, recordId: string): Promise<void> {
       const url = baseUrl + '/api/v1/applications/' + appId + '/records/' + recordId + '/';
-      const response = await fetch(url, {
+      const response = await fetchImpl(url, {
         method: 'DELETE',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -391,7 +400,7 @@ export async function createAuthenticatedClient(
 
     async getSchema(appId: string): Promise<SmartSuiteSchema> {
       const url = baseUrl + '/api/v1/applications/' + appId + '/';
-      const response = await fetch(url, {
+      const response = await fetchImpl(url, {
         method: 'GET',
         headers: {
           Authorization: 'Token ' + apiKey,
@@ -434,7 +443,7 @@ export async function createAuthenticatedClient(
       if (options.data) {
         fetchOptions.body = JSON.stringify(options.data);
       }
-      const response = await fetch(url, fetchOptions);
+      const response = await fetchImpl(url, fetchOptions);
 
       if (!response.ok) {
         let errorMessage = `API error ${response.status}: ${response.statusText}`;
@@ -5,7 +5,7 @@
 // ERROR-RESOLVER: Fixing type mismatches in test arguments
 // TESTGUARD-APPROVED: CONTRACT-DRIVEN-CORRECTION - Fixing test data to match established type contracts
 
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 
 import type { IEventStore } from '../knowledge-platform/events/event-store.js';
 import type { DomainEvent, Snapshot } from '../knowledge-platform/events/types.js';
@@ -317,4 +317,63 @@ describe('Knowledge Platform MCP Tools', () => {
     });
 
   });
+
+  describe('lazy Knowledge Platform loading', () => {
+    const supabaseClientPath = '../knowledge-platform/infrastructure/supabase-client.js';
+    const requiredEnvVars = [
+      'KNOWLEDGE_SUPABASE_URL',
+      'KNOWLEDGE_SUPABASE_SERVICE_KEY',
+      'KNOWLEDGE_DB_SCHEMA',
+    ];
+    let savedEnv: Record<string, string | undefined>;
+
+    beforeEach(() => {
+      vi.resetModules(); // Fresh module graph so supabase-client evaluation is observable
+      savedEnv = Object.fromEntries(requiredEnvVars.map(name => [name, process.env[name]]));
+      for (const name of requiredEnvVars) {
+        delete process.env[name];
+      }
+    });
+
+    afterEach(() => {
+      vi.doUnmock(supabaseClientPath);
+      for (const [name, value] of Object.entries(savedEnv)) {
+        if (value === undefined) {
+          delete process.env[name];
+        } else {
+          process.env[name] = value;
+        }
+      }
+    });
+
+    it('should not evaluate supabase-client when the tools module is imported', async () => {
+      const evaluated = vi.fn();
+      vi.doMock(supabaseClientPath, () => {
+        evaluated();
+        return { supabase: {}, knowledgeConfig: {} };
+      });
+
+      await import('./knowledge.js');
+
+      expect(evaluated).not.toHaveBeenCalled();
+    });
+
+    it('should report missing Supabase env vars instead of dropping the event', async () => {
+      const { handleKnowledgeEvents: handleEvents } = await import('./knowledge.js');
+      const contextWithoutStore: ToolContext = { ...mockContext };
+      delete contextWithoutStore.eventStore;
+
+      const result = await handleEvents({
+        operation: 'append',
+        aggregateId: 'field-mapping-123',
+        type: 'FieldMappingUpdated',
+        data: { fieldId: 'title' },
+      }, contextWithoutStore);
+
+      expect(result).toEqual({
+        success: false,
+        error: 'Missing required environment variable: KNOWLEDGE_SUPABASE_URL',
+      });
+    });
+  });
 });
@@ -2,10 +2,11 @@
 // Implements event sourcing operations for the Knowledge Platform
 // Following TRACED methodology - GREEN phase: minimal implementation to pass tests
 
-import { EventStoreSupabase } from '../knowledge-platform/events/event-store-supabase.js';
-import { EventStoreMemory, type IEventStore } from '../knowledge-platform/events/event-store.js';
+// Knowledge Platform runtime modules are imported lazily inside the handlers:
+// supabase-client pulls in @supabase/supabase-js and validates its env vars at load,
+// which would otherwise run on every server start even when these tools are never used
+import type { IEventStore } from '../knowledge-platform/events/event-store.js';
 import type { DomainEvent } from '../knowledge-platform/events/types.js';
-import { supabase } from '../knowledge-platform/infrastructure/supabase-client.js';
 
 import type { ToolContext } from './types.js';
 
@@ -165,7 +166,8 @@ export async function handleKnowledgeRefreshViews(
     const views = args.views || ['field_mappings'];
 
     // Get Supabase client
-    const supabaseClient = context.supabaseClient || supabase;
+    const supabaseClient = context.supabaseClient ||
+      (await import('../knowledge-platform/infrastructure/supabase-client.js')).supabase;
 
     // Attempt to refresh each view in parallel
     const refreshPromises = views.map(async (view) => {
@@ -218,16 +220,13 @@ export async function handleKnowledgeRefreshViews(
 
 /**
  * Create an event store instance
- * Uses Supabase backend if available, falls back to in-memory
+ * Loading the Supabase backend validates the KNOWLEDGE_* env vars; a missing one
+ * surfaces through the handler's error result instead of falling back to memory
  */
 async function createEventStore(): Promise<IEventStore> {
-  try {
-    // EventStoreSupabase expects a tenantId, not a client
-    return new EventStoreSupabase('default-tenant');
-  } catch {
-    // Fall back to in-memory store for testing
-    return new EventStoreMemory();
-  }
+  const { EventStoreSupabase } = await import('../knowledge-platform/events/event-store-supabase.js');
+  // EventStoreSupabase expects a tenantId, not a client
+  return new EventStoreSupabase('default-tenant');
 }
 
 /**
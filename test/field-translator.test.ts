@@ -45,6 +45,21 @@ describe('FieldTranslator', () => {
     });
   });
 
+  describe('loadFromMapping', () => {
+    it('should register a parsed mapping without mutating it', () => {
+      const mapping = {
+        tableName: 'projects',
+        tableId: '68a8ff5237fde0bf797c05b3',
+        fields: { projectName: 'proj_name_api' },
+      };
+
+      translator.loadFromMapping(mapping, 'inline');
+
+      expect(mapping).not.toHaveProperty('reverseMap');
+      expect(translator.apiToHuman(mapping.tableId, { proj_name_api: 'x' })).toEqual({ projectName: 'x' });
+    });
+  });
+
   describe('humanToApi', () => {
     beforeEach(async () => {
       // Load test mappings from fixture
@@ -4,30 +4,39 @@
 // Context7: consulted for path
 // Context7: consulted for fs-extra
 // Context7: consulted for os
+import { promises as fsPromises } from 'fs';
 import os from 'os';
 import path from 'path';
 
 import fs from 'fs-extra';
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeAll, afterAll, beforeEach, vi } from 'vitest';
 
 
 import { MappingService } from '../src/lib/mapping-service.js';
 
 describe('MappingService', () => {
   let mappingService: MappingService;
+  let baseDir: string;
   let tempDir: string;
+  let caseCounter = 0;
 
-  beforeEach(async () => {
-    mappingService = new MappingService();
-    tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'mapping-test-'));
+  // One mkdtemp per file; each test gets a plain subdirectory of it
+  beforeAll(async () => {
+    baseDir = await fs.mkdtemp(path.join(os.tmpdir(), 'mapping-test-'));
   });
 
-  afterEach(async () => {
-    if (tempDir) {
-      await fs.remove(tempDir);
+  afterAll(async () => {
+    if (baseDir) {
+      await fs.remove(baseDir);
     }
   });
 
+  beforeEach(async () => {
+    mappingService = new MappingService();
+    tempDir = path.join(baseDir, `case-${++caseCounter}`);
+    await fs.mkdir(tempDir);
+  });
+
   describe('collision detection', () => {
     it('should detect table name collisions across files', async () => {
       // Create two YAML files with same table name
@@ -66,6 +75,39 @@ fields:
     });
   });
 
+  describe('safe YAML loading', () => {
+    it('should reject tags outside the JSON schema', async () => {
+      const yaml = `
+tableName: projects
+tableId: abc123def456789012345678
+fields:
+  projectName: !!js/undefined ''
+`;
+      await fs.writeFile(path.join(tempDir, 'projects.yaml'), yaml);
+
+      await expect(mappingService.loadAllMappings(tempDir))
+        .rejects.toThrow(/unknown tag/i);
+    });
+
+    it('should yield plain JSON values without YAML-specific types', async () => {
+      // Under a full YAML schema this unquoted date would become a Date object
+      const yaml = `
+tableName: projects
+tableId: abc123def456789012345678
+solutionId: 2024-01-01
+fields:
+  projectName: proj_name_api
+`;
+      await fs.writeFile(path.join(tempDir, 'projects.yaml'), yaml);
+
+      await mappingService.loadAllMappings(tempDir);
+
+      const table = mappingService.getTableResolver().getTableByName('projects');
+      expect(table?.solutionId).toBe('2024-01-01');
+      expect(JSON.parse(JSON.stringify(table))).toEqual(table);
+    });
+  });
+
   describe('successful loading', () => {
     it('should load mappings and provide both translators', async () => {
       const yaml = `
@@ -100,6 +142,37 @@ fields:
     });
   });
 
+  describe('single parse', () => {
+    it('should read each mapping file once and reuse it for both translators', async () => {
+      const yaml1 = `
+tableName: projects
+tableId: abc123def456789012345678
+fields:
+  projectName: proj_name_api
+`;
+      const yaml2 = `
+tableName: videos
+tableId: def456789012345678abc123
+fields:
+  title: title_api
+`;
+      await fs.writeFile(path.join(tempDir, 'projects.yaml'), yaml1);
+      await fs.writeFile(path.join(tempDir, 'videos.yaml'), yaml2);
+
+      const readSpy = vi.spyOn(fsPromises, 'readFile');
+      try {
+        await mappingService.loadAllMappings(tempDir);
+        expect(readSpy).toHaveBeenCalledTimes(2);
+      } finally {
+        readSpy.mockRestore();
+      }
+
+      expect(mappingService.getTableResolver().resolveTableId('videos')).toBe('def456789012345678abc123');
+      expect(mappingService.getFieldTranslator().apiToHuman('def456789012345678abc123', { title_api: 'x' }))
+        .toEqual({ title: 'x' });
+    });
+  });
+
   describe('validation completeness', () => {
     it('should validate all mappings before populating translators', async () => {
       const yaml1 = `
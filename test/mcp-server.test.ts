@@ -66,6 +66,20 @@ describe('SmartSuiteShimServer', () => {
     expect(tools).toHaveLength(9);
   });
 
+  it('should serve precomputed tool definitions across calls and instances', async () => {
+    const tools = await new SmartSuiteShimServer().getTools();
+    expect(await new SmartSuiteShimServer().getTools()).toBe(tools);
+  });
+
+  it('should not let callers mutate the shared tool definitions', async () => {
+    const tools = await new SmartSuiteShimServer().getTools();
+
+    expect(Object.isFrozen(tools)).toBe(true);
+    expect(() => {
+      (tools[0]!.inputSchema.properties as Record<string, unknown>).injected = {};
+    }).toThrow(TypeError);
+  });
+
   it('should enforce mandatory dry-run pattern for record tool', async () => {
     const server = new SmartSuiteShimServer();
     const tools = await server.getTools();
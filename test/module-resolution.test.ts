@@ -2,12 +2,14 @@
 // Critical-Engineer: consulted for Node.js ESM module resolution strategy
 // Context7: consulted for vitest
 // Context7: consulted for child_process
+// Context7: consulted for module
 // Context7: consulted for util
 // Context7: consulted for fs/promises
 // Context7: consulted for path
 // TESTGUARD_BYPASS: SECURITY-001 - Fixing shell command injection warnings from GitHub Advanced Security
 import { execFile } from 'child_process';
 import * as fs from 'fs/promises';
+import { createRequire } from 'module';
 import * as path from 'path';
 import { promisify } from 'util';
 
@@ -15,6 +17,10 @@ import { describe, it, expect, beforeAll, afterAll } from 'vitest';
 
 const execFileAsync = promisify(execFile);
 
+// Run the project's TypeScript compiler directly on the current Node binary:
+// `npx tsc` spawns an npm CLI process (and its startup) before tsc itself
+const tscBin = createRequire(import.meta.url).resolve('typescript/bin/tsc');
+
 describe('ES Module Resolution', () => {
   const testBuildDir = path.join(process.cwd(), 'test-build');
 
@@ -75,7 +81,7 @@ console.log(instance.getValue());`;
     );
 
     // Compile the TypeScript (using execFile to avoid shell injection)
-    const { stderr: tscError } = await execFileAsync('npx', ['tsc'], { cwd: testBuildDir });
+    const { stderr: tscError } = await execFileAsync(process.execPath, [tscBin], { cwd: testBuildDir });
 
     // TypeScript should compile successfully
     expect(tscError).toBe('');
@@ -89,7 +95,7 @@ console.log(instance.getValue());`;
 
     // Test that Node.js can actually run the compiled code (using execFile for security)
     const { stdout: nodeOutput, stderr: nodeError } = await execFileAsync(
-      'node',
+      process.execPath,
       ['dist/test-main.js'],
       { cwd: testBuildDir },
     );
@@ -131,37 +137,35 @@ console.log(badValue);`;
     );
 
     // Compile with the bad config (using execFile to avoid shell injection)
-    await execFileAsync('npx', ['tsc', '-p', 'tsconfig-bad.json'], { cwd: testBuildDir });
+    await execFileAsync(process.execPath, [tscBin, '-p', 'tsconfig-bad.json'], { cwd: testBuildDir });
 
     // Try to run the compiled code - it should fail
-    try {
-      await execFileAsync('node', ['dist-bad/bad-main.js'], { cwd: testBuildDir });
-      // If we get here, the test failed - it should have thrown
-      expect(true).toBe(false);
-    } catch (error: any) {
-      // Expected error - Node.js can't find the module without .js
-      expect(error.message).toContain('ERR_MODULE_NOT_FOUND');
-      expect(error.message).toContain('bad-module');
-    }
+    // Asserting on the rejection directly: a sentinel expect(true).toBe(false) inside the
+    // try block was swallowed by its own catch and surfaced as a misleading message mismatch
+    const run = execFileAsync(process.execPath, ['dist-bad/bad-main.js'], { cwd: testBuildDir });
+
+    // Expected error - Node.js can't find the module without .js
+    await expect(run).rejects.toThrow('ERR_MODULE_NOT_FOUND');
+    await expect(run).rejects.toThrow('bad-module');
   });
 
   it('should validate build output can be executed by Node.js', async () => {
     // TESTGUARD-APPROVED: TESTGUARD-20250917-d66a609a
     // Test the actual build output (using execFile with env for security)
-    // Provide dummy environment variables for supabase-client.js initialization
-    const { stderr } = await execFileAsync('node', ['build/src/index.js'], {
+    // Knowledge Platform modules load lazily, so startup must not need the KNOWLEDGE_* vars
+    const env: NodeJS.ProcessEnv = { ...process.env, MCP_VALIDATE_AND_EXIT: 'true' };
+    delete env.KNOWLEDGE_SUPABASE_URL;
+    delete env.KNOWLEDGE_SUPABASE_SERVICE_KEY;
+    delete env.KNOWLEDGE_DB_SCHEMA;
+
+    const { stdout, stderr } = await execFileAsync(process.execPath, ['build/src/index.js'], {
       cwd: process.cwd(),
-      env: {
-        ...process.env,
-        MCP_VALIDATE_AND_EXIT: 'true',
-        // Dummy values for supabase-client.js import-time validation
-        KNOWLEDGE_SUPABASE_URL: 'https://dummy.supabase.co',
-        KNOWLEDGE_SUPABASE_SERVICE_KEY: 'dummy-service-key-for-testing',
-        KNOWLEDGE_DB_SCHEMA: 'test_schema',
-      },
+      env,
     });
 
-    // Should run without module resolution errors
+    // Should run without module resolution errors or Supabase config checks
     expect(stderr).not.toContain('ERR_MODULE_NOT_FOUND');
+    expect(stderr).not.toContain('Missing required environment variable');
+    expect(stdout).toContain('CI startup validation successful');
   });
 });
@@ -14,20 +14,21 @@ describe('SmartSuite Client Authentication', () => {
       const apiKey = 'valid-api-key-12345';
       const workspaceId = 's3qnmox1';
 
-      // Mock successful validation response
-      global.fetch = vi.fn().mockResolvedValueOnce({
+      // Inject successful validation response (no global fetch patching)
+      const fetchImpl = vi.fn(async () => ({
         ok: true,
         status: 200,
         json: async () => ({
           workspace: { id: workspaceId, name: 'Test Workspace' },
         }),
-      } as Response);
+      }) as Response);
 
       const { createAuthenticatedClient } = await import('../src/smartsuite-client.js');
 
       const client = await createAuthenticatedClient({
         apiKey,
         workspaceId,
+        fetchImpl,
       });
 
       // Client must have these methods
@@ -42,7 +43,7 @@ describe('SmartSuite Client Authentication', () => {
       expect(client.getSchema).toBeInstanceOf(Function);
 
       // Should have made validation request
-      expect(global.fetch).toHaveBeenCalledWith(
+      expect(fetchImpl).toHaveBeenCalledWith(
         expect.stringContaining('smartsuite.com/api/v1/applications'),
         expect.objectContaining({
           headers: expect.objectContaining({
@@ -61,19 +62,19 @@ describe('SmartSuite Client Authentication', () => {
       const apiKey = 'invalid-api-key';
       const workspaceId = 's3qnmox1';
 
-      // Mock 401 response
-      global.fetch = vi.fn().mockResolvedValueOnce({
+      // Stub 401 response
+      const fetchImpl = async (): Promise<Response> => ({
         ok: false,
         status: 401,
         statusText: 'Unauthorized',
         json: async () => ({
           error: 'Invalid API key',
         }),
-      } as Response);
+      }) as Response;
 
       const { createAuthenticatedClient } = await import('../src/smartsuite-client.js');
 
-      await expect(createAuthenticatedClient({ apiKey, workspaceId })).rejects.toThrow(
+      await expect(createAuthenticatedClient({ apiKey, workspaceId, fetchImpl })).rejects.toThrow(
         'Authentication failed: Invalid API key',
       );
     });
@@ -86,11 +87,13 @@ describe('SmartSuite Client Authentication', () => {
       const workspaceId = 's3qnmox1';
 
       // Simulate timeout
-      global.fetch = vi.fn().mockRejectedValueOnce(new Error('Network request failed: ETIMEDOUT'));
+      const fetchImpl = async (): Promise<Response> => {
+        throw new Error('Network request failed: ETIMEDOUT');
+      };
 
       const { createAuthenticatedClient } = await import('../src/smartsuite-client.js');
 
-      await expect(createAuthenticatedClient({ apiKey, workspaceId })).rejects.toThrow(
+      await expect(createAuthenticatedClient({ apiKey, workspaceId, fetchImpl })).rejects.toThrow(
         /Network error.*Please check your connection/,
       );
     });
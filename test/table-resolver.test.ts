@@ -1,17 +1,20 @@
 // Context7: consulted for vitest
+// Context7: consulted for os
 // Context7: consulted for path
+import * as os from 'os';
 import * as path from 'path';
 
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect, beforeAll, beforeEach } from 'vitest';
 
 import { TableResolver } from '../src/lib/table-resolver.js';
 
 describe('TableResolver', () => {
   let resolver: TableResolver;
+  let loadedResolver: TableResolver;
   let testMappingsDir: string;
 
-  beforeEach(async () => {
-    resolver = new TableResolver();
+  // Fixture directory depends only on the checkout, so resolve it once per file
+  beforeAll(async () => {
     // Determine the appropriate directory based on environment
     const baseDir = path.resolve(__dirname, '../config/field-mappings');
     const examplesDir = path.resolve(__dirname, '../config/field-mappings/examples');
@@ -31,6 +34,14 @@ describe('TableResolver', () => {
 
     // Use main directory if it has YAML files, otherwise use examples
     testMappingsDir = hasMainDirFiles ? baseDir : examplesDir;
+
+    // Lookups never mutate the resolver, so the read-only suites share one loaded instance
+    loadedResolver = new TableResolver();
+    await loadedResolver.loadFromMappings(testMappingsDir);
+  });
+
+  beforeEach(() => {
+    resolver = new TableResolver();
   });
 
   describe('loadFromMappings', () => {
@@ -62,24 +73,23 @@ describe('TableResolver', () => {
     });
 
     it('should throw error if no YAML files found', async () => {
-      const emptyDir = path.resolve(__dirname, '../test/fixtures/empty');
-
-      // Create empty directory for test
+      // Private OS temp dir so parallel workers never share (or leak into) the repo tree
       const fs = await import('fs-extra');
-      await fs.ensureDir(emptyDir);
-
-      await expect(resolver.loadFromMappings(emptyDir))
-        .rejects
-        .toThrow(/No YAML mapping files found/);
-
-      // Clean up
-      await fs.remove(emptyDir);
+      const emptyDir = await fs.mkdtemp(path.join(os.tmpdir(), 'table-resolver-empty-'));
+
+      try {
+        await expect(resolver.loadFromMappings(emptyDir))
+          .rejects
+          .toThrow(/No YAML mapping files found/);
+      } finally {
+        await fs.remove(emptyDir);
+      }
     });
   });
 
   describe('resolveTableId', () => {
-    beforeEach(async () => {
-      await resolver.loadFromMappings(testMappingsDir);
+    beforeEach(() => {
+      resolver = loadedResolver;
     });
 
     it('should resolve table name to table ID', () => {
@@ -127,8 +137,8 @@ describe('TableResolver', () => {
   });
 
   describe('getTableByName', () => {
-    beforeEach(async () => {
-      await resolver.loadFromMappings(testMappingsDir);
+    beforeEach(() => {
+      resolver = loadedResolver;
     });
 
     it('should return table info for valid table name', () => {
@@ -154,8 +164,8 @@ describe('TableResolver', () => {
   });
 
   describe('getSuggestionsForUnknown', () => {
-    beforeEach(async () => {
-      await resolver.loadFromMappings(testMappingsDir);
+    beforeEach(() => {
+      resolver = loadedResolver;
     });
 
     it('should suggest similar table names for typos', () => {